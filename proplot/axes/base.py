@@ -74,6 +74,14 @@ LOC_TRANSLATE = {  # for inset colorbars and legends TODO: also as text location
     'uc': 'upper center',
     'lc': 'lower center',
 }
+TITLE_POSITIONS = {  # inset title (x, x pad sign, y, y pad sign) in axes coordinates
+    'upper left': (0, 1, 1, -1),
+    'upper right': (1, -1, 1, -1),
+    'upper center': (0.5, 0, 1, -1),
+    'lower left': (0, 1, 0, 1),
+    'lower right': (1, -1, 0, 1),
+    'lower center': (0.5, 0, 0, 1),
+}
 
 
 docstring.snippets['axes.other'] = """
@@ -676,30 +684,23 @@ class Axes(maxes.Axes):
         titles. This is called by matplotlib at drawtime.
         """
         # Custom inset titles
+        # NOTE: This runs on every draw, so read the pad once and look up
+        # the offsets for each location in a table. Empty titles are skipped
+        # since most sit empty and set_position marks them stale. They are
+        # positioned on the first draw after their text is set.
         width, height = self.get_size_inches()
-        for loc in (
-            'abc',
-            'upper left', 'upper right', 'upper center',
-            'lower left', 'lower right', 'lower center',
-        ):
+        pad = rc['axes.titlepad'] / 72
+        xpad, ypad = pad / width, pad / height
+        for loc in ('abc', *TITLE_POSITIONS):
             obj = self._get_title(loc)
+            if not obj.get_text():
+                continue
             if loc == 'abc':
                 loc = self._abc_loc
                 if loc in ('left', 'right', 'center'):
                     continue
-            pad = rc['axes.titlepad'] / (72 * width)
-            if loc in ('upper center', 'lower center'):
-                x = 0.5
-            elif loc in ('upper left', 'lower left'):
-                x = pad
-            elif loc in ('upper right', 'lower right'):
-                x = 1 - pad
-            pad = rc['axes.titlepad'] / (72 * height)
-            if loc in ('upper left', 'upper right', 'upper center'):
-                y = 1 - pad
-            elif loc in ('lower left', 'lower right', 'lower center'):
-                y = pad
-            obj.set_position((x, y))
+            x, xsign, y, ysign = TITLE_POSITIONS[loc]
+            obj.set_position((x + xsign * xpad, y + ysign * ypad))
 
         # Push title above tick marks, since builtin algorithm used to offset
         # the title seems to ignore them. This is known matplotlib problem but
@@ -873,7 +874,10 @@ optional
         # one axes, but operations are fast so some redundancy is nbd.
         # NOTE: Below kludge prevents changed *figure-wide* settings
         # from getting overwritten when user makes a new axes.
+        # NOTE: The font family is shared by every text object below, so it is
+        # only looked up once. It is always the last property applied.
         fig = self.figure
+        family = rc.fill({'fontfamily': 'font.family'}, context=True)
         suptitle = _not_none(figtitle=figtitle, suptitle=suptitle)
         if len(fig._axes_main) > 1 and rc._context and rc._context[-1].mode == 1:
             kw = {}
@@ -883,10 +887,10 @@ optional
                     'fontsize': 'suptitle.size',
                     'weight': 'suptitle.weight',
                     'color': 'suptitle.color',
-                    'fontfamily': 'font.family'
                 },
                 context=True,
             )
+            kw.update(family)
         if suptitle or kw:
             fig._update_super_title(suptitle, **kw)
 
@@ -899,19 +903,22 @@ optional
         tlabels = _not_none(
             collabels=collabels, toplabels=toplabels, tlabels=tlabels,
         )
-        for side, labels in zip(
-            ('left', 'right', 'top', 'bottom'),
-            (llabels, rlabels, tlabels, blabels)
-        ):
-            kw = rc.fill(
-                {
-                    'fontsize': side + 'label.size',
-                    'weight': side + 'label.weight',
-                    'color': side + 'label.color',
-                    'fontfamily': 'font.family'
-                },
-                context=True,
-            )
+        sides = ('left', 'right', 'top', 'bottom')
+        kw_sides = rc.fill(
+            {
+                (side, key): side + 'label.' + prop
+                for side in sides
+                for key, prop in (
+                    ('fontsize', 'size'), ('weight', 'weight'), ('color', 'color')
+                )
+            },
+            context=True,
+        )
+        for side, labels in zip(sides, (llabels, rlabels, tlabels, blabels)):
+            kw = {
+                key: value for (iside, key), value in kw_sides.items() if iside == side
+            }
+            kw.update(family)
             if labels or kw:
                 fig._update_subplot_labels(self, side, labels, **kw)
 
@@ -935,17 +942,13 @@ optional
                     'fontsize': 'abc.size',
                     'weight': 'abc.weight',
                     'color': 'abc.color',
-                    'fontfamily': 'font.family',
-                },
-                context=True
-            )
-            kwb = rc.fill(
-                {
                     'border': 'abc.border',
                     'borderwidth': 'abc.borderwidth',
                 },
-                context=True,
+                context=True
             )
+            kw.update(family)
+            kwb = {key: kw.pop(key) for key in ('border', 'borderwidth') if key in kw}
             self._abc_border_kwargs.update(kwb)
             kw.update(self._abc_border_kwargs)
 
@@ -999,19 +1002,15 @@ optional
                 'fontsize': 'title.size',
                 'weight': 'title.weight',
                 'color': 'title.color',
-                'fontfamily': 'font.family',
+                'border': 'title.border',
+                'borderwidth': 'title.borderwidth',
             },
             context=True
         )
+        kw.update(family)
         if 'color' in kw and kw['color'] == 'auto':
             del kw['color']  # WARNING: matplotlib permits invalid color here
-        kwb = rc.fill(
-            {
-                'border': 'title.border',
-                'borderwidth': 'title.borderwidth',
-            },
-            context=True,
-        )
+        kwb = {key: kw.pop(key) for key in ('border', 'borderwidth') if key in kw}
         self._title_border_kwargs.update(kwb)
         kw.update(self._title_border_kwargs)
 
@@ -1689,25 +1688,19 @@ optional
         # of each joint
         x, y = args  # standardized by parametric wrapper
         interp  # avoid U100 unused argument error (arg is handled by wrapper)
-        coords = []
+        # NOTE: Each joint gets the segment (left halfway point, joint, right
+        # halfway point), and the end joints drop their missing halves.
         levels = edges(values)
-        for j in range(y.shape[0]):
-            if j == 0:
-                xleft, yleft = [], []
-            else:
-                xleft = [0.5 * (x[j - 1] + x[j]), x[j]]
-                yleft = [0.5 * (y[j - 1] + y[j]), y[j]]
-            if j + 1 == y.shape[0]:
-                xright, yright = [], []
-            else:
-                xleft = xleft[:-1]  # prevent repetition when joined with right
-                yleft = yleft[:-1]
-                xright = [x[j], 0.5 * (x[j + 1] + x[j])]
-                yright = [y[j], 0.5 * (y[j + 1] + y[j])]
-            pleft = np.stack((xleft, yleft), axis=1)
-            pright = np.stack((xright, yright), axis=1)
-            coords.append(np.concatenate((pleft, pright), axis=0))
-        coords = np.array(coords)
+        coords = np.empty((y.shape[0], 3, 2), dtype=float)
+        coords[:, 1, 0] = x  # fill the joint lanes directly
+        coords[:, 1, 1] = y
+        np.add(coords[:-1, 1], coords[1:, 1], out=coords[1:, 0])
+        coords[1:, 0] *= 0.5
+        coords[:-1, 2] = coords[1:, 0]
+        if coords.shape[0] > 1:
+            coords = [coords[0, 1:], *coords[1:-1], coords[-1, :2]]
+        else:
+            coords = coords[:, :0]  # no line segments for a single point
 
         # Create LineCollection and update with values
         # NOTE: Default capstyle is butt but this may look weird with vector graphics
@@ -1717,10 +1710,8 @@ optional
         )
         values = np.asarray(values)
         hs.set_array(values)
-        hs.update({
-            key: value for key, value in kwargs.items()
-            if key not in ('color',)
-        })
+        kwargs.pop('color', None)  # colors are set by the colormap
+        hs.update(kwargs)
 
         # Add collection with some custom attributes
         # NOTE: Modern API uses self._request_autoscale_view but this is
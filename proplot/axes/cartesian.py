@@ -340,7 +340,7 @@ class CartesianAxes(base.Axes):
         child._update_transScale()
         funcscale.set_default_locators_and_formatters(child.xaxis, only_if_default=True)
         nlim = list(map(funcscale.functions[1], np.array(olim)))
-        if np.sign(np.diff(olim)) != np.sign(np.diff(nlim)):
+        if np.sign(olim[1] - olim[0]) != np.sign(nlim[1] - nlim[0]):
             nlim = nlim[::-1]  # if function flips limits, so will set_xlim!
         child.set_xlim(nlim, emit=False)
         self._dualx_parent_prev_state = (scale, *olim)
@@ -362,7 +362,7 @@ class CartesianAxes(base.Axes):
         child._update_transScale()
         funcscale.set_default_locators_and_formatters(child.yaxis, only_if_default=True)
         nlim = list(map(funcscale.functions[1], np.array(olim)))
-        if np.sign(np.diff(olim)) != np.sign(np.diff(nlim)):
+        if np.sign(olim[1] - olim[0]) != np.sign(nlim[1] - nlim[0]):
             nlim = nlim[::-1]
         child.set_ylim(nlim, emit=False)
         self._dualy_parent_prev_state = (scale, *olim)
@@ -812,6 +812,29 @@ class CartesianAxes(base.Axes):
                 if ylabelloc not in (None, 'left', 'right'):
                     ylabelloc = 'left'
 
+            # Spine and gridline properties shared by both axes
+            # NOTE: These do not depend on the axis, so look them up once
+            # rather than for every x and y iteration.
+            kwspines = rc.fill(
+                {
+                    'color': 'axes.edgecolor',
+                    'linewidth': 'axes.linewidth',
+                },
+                context=True,
+            )
+            kwgrids = {
+                which: rc.fill(
+                    {
+                        'grid_color': name + '.color',
+                        'grid_alpha': name + '.alpha',
+                        'grid_linewidth': name + '.linewidth',
+                        'grid_linestyle': name + '.linestyle',
+                    },
+                    context=True,
+                )
+                for which, name in (('major', 'grid'), ('minor', 'gridminor'))
+            }
+
             # Begin loop
             for (
                 x, axis,
@@ -893,25 +916,18 @@ class CartesianAxes(base.Axes):
                 date = isinstance(axis.converter, mdates.DateConverter)
 
                 # Fix spines
-                kw = rc.fill(
-                    {
-                        'color': 'axes.edgecolor',
-                        'linewidth': 'axes.linewidth',
-                    },
-                    context=True,
-                )
+                kw = kwspines.copy()
                 if color is not None:
                     kw['color'] = color
                 if linewidth is not None:
                     kw['linewidth'] = linewidth
                 sides = ('bottom', 'top') if x == 'x' else ('left', 'right')
                 spines = [self.spines[side] for side in sides]
+                # Line properties. Override if we're settings spine bounds
+                # In this case just have spines on edges by default
+                if bounds is not None and spineloc not in sides:
+                    spineloc = sides[0]
                 for spine, side in zip(spines, sides):
-                    # Line properties. Override if we're settings spine bounds
-                    # In this case just have spines on edges by default
-                    if bounds is not None and spineloc not in sides:
-                        spineloc = sides[0]
-
                     # Eliminate sides
                     if spineloc == 'neither':
                         spine.set_visible(False)
@@ -967,18 +983,9 @@ class CartesianAxes(base.Axes):
                             kwticks['size'] *= rc['ticklenratio']
 
                     # Grid style and toggling
-                    name = 'grid' if which == 'major' else 'gridminor'
                     if igrid is not None:
                         axis.grid(igrid, which=which)
-                    kwgrid = rc.fill(
-                        {
-                            'grid_color': name + '.color',
-                            'grid_alpha': name + '.alpha',
-                            'grid_linewidth': name + '.linewidth',
-                            'grid_linestyle': name + '.linestyle',
-                        },
-                        context=True,
-                    )
+                    kwgrid = kwgrids[which].copy()
                     if gridcolor is not None:  # override for specific x/y axes
                         kw['grid_color'] = gridcolor
                     axis.set_tick_params(which=which, **kwgrid, **kwticks)
@@ -990,7 +997,7 @@ class CartesianAxes(base.Axes):
                 # So calling _format_axes() a second time will remove the lines.
                 # First determine tick sides, avoiding situation where we draw ticks
                 # on top of invisible spine.
-                kw = {}
+                kwsides = {}
                 loc2sides = {
                     None: None,
                     'both': sides,
@@ -1001,17 +1008,17 @@ class CartesianAxes(base.Axes):
                     tickloc = sides[0]  # override to just one side
                 ticklocs = loc2sides.get(tickloc, (tickloc,))
                 if ticklocs is not None:
-                    kw.update({side: side in ticklocs for side in sides})
-                kw.update({side: False for side in sides if side not in spines})
+                    kwsides.update({side: side in ticklocs for side in sides})
+                kwsides.update({side: False for side in sides if side not in spines})
 
                 # Tick label sides
                 # Will override to make sure only appear where ticks are
                 ticklabellocs = loc2sides.get(ticklabelloc, (ticklabelloc,))
                 if ticklabellocs is not None:
-                    kw.update(
+                    kwsides.update(
                         {'label' + side: (side in ticklabellocs) for side in sides}
                     )
-                kw.update(  # override
+                kwsides.update(  # override
                     {
                         'label' + side: False for side in sides
                         if side not in spines
@@ -1034,8 +1041,7 @@ class CartesianAxes(base.Axes):
                         + ', '.join(map(repr, sides)) + '.'
                     )
 
-                # Apply
-                axis.set_tick_params(which='both', **kw)
+                # Apply the axis label side
                 if labelloc is not None:
                     axis.set_label_position(labelloc)
 
@@ -1061,7 +1067,9 @@ class CartesianAxes(base.Axes):
                     kw['pad'] -= rc._scale_font(rc[f'{x}tick.labelsize'])
                 if tickdir is not None:
                     kw['direction'] = tickdir
-                axis.set_tick_params(which='both', **kw)
+                # NOTE: Tick sides and tick label settings are applied together
+                # since each set_tick_params call updates every existing tick.
+                axis.set_tick_params(which='both', **kwsides, **kw)
 
                 # Settings that can't be controlled by set_tick_params
                 # Also set rotation and alignment here
@@ -1078,8 +1086,9 @@ class CartesianAxes(base.Axes):
                         self._datex_rotated = True
                         if rotation not in (0, 90, -90):
                             kw['ha'] = ('right' if rotation > 0 else 'left')
-                for t in axis.get_ticklabels():
-                    t.update(kw)
+                if kw:  # skip fetching the tick labels when there is nothing to set
+                    for t in axis.get_ticklabels():
+                        t.update(kw)
 
                 # Margins
                 if margin is not None:
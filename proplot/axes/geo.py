@@ -3,9 +3,12 @@
 Axes filled with cartographic projections.
 """
 import copy
+import functools
+import itertools
 
 import matplotlib.axes as maxes
 import matplotlib.axis as maxis
+import matplotlib.collections as mcollections
 import matplotlib.path as mpath
 import matplotlib.text as mtext
 import matplotlib.ticker as mticker
@@ -24,6 +27,7 @@ from .plot import (
     _cycle_changer,
     _default_latlon,
     _default_transform,
+    _get_platecarree,
     _indicate_error,
     _plot_wrapper,
     _scatter_wrapper,
@@ -47,7 +51,24 @@ except ModuleNotFoundError:
 
 __all__ = ['GeoAxes', 'BasemapAxes', 'CartopyAxes']
 
+# Label array indices for the gridline label side characters
+LABEL_SIDES = {'l': 0, 'r': 1, 'b': 2, 't': 3}
 
+# Prefixes for settings used by the GeoAxes.format worker functions
+GEO_SETTINGS = ('axes.', 'grid', 'reso', *constructor.CARTOPY_FEATURES)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_natural_earth(category, name, reso):
+    """
+    Return a `~cartopy.feature.NaturalEarthFeature` shared across all cartopy
+    axes. Features are only data sources, so reusing them lets cartopy reuse
+    each feature's cached geometries.
+    """
+    return cfeature.NaturalEarthFeature(category, name, reso)
+
+
+@functools.lru_cache(maxsize=8)
 def _circle_boundary(N=100):
     """
     Return a circle `~matplotlib.path.Path` used as the outline for polar
@@ -55,10 +76,14 @@ def _circle_boundary(N=100):
     projections. This was developed from `this cartopy example \
 <https://scitools.org.uk/cartopy/docs/v0.15/examples/always_circular_stereo.html>`__.
     """
+    # NOTE: The path is cached and shared between axes, so it is made read-only
+    # like the matplotlib.path.Path.unit_circle() cache.
     theta = np.linspace(0, 2 * np.pi, N)
-    center, radius = [0.5, 0.5], 0.5
-    verts = np.vstack([np.sin(theta), np.cos(theta)]).T
-    return mpath.Path(verts * radius + center)
+    center, radius = 0.5, 0.5
+    verts = np.column_stack((np.sin(theta), np.cos(theta)))
+    verts *= radius
+    verts += center
+    return mpath.Path(verts, readonly=True)
 
 
 class _GeoAxis(object):
@@ -94,16 +119,17 @@ class _GeoAxis(object):
     def _pad_ticks(ticks, vmin, vmax):
         # Wrap up to the longitude/latitude range to avoid
         # giant lists of 10,000 gridline locations.
-        range_ = max(ticks) - min(ticks)
+        range_ = ticks[-1] - ticks[0]  # ticks are sorted
         vmin = max(vmin, ticks[0] - range_)
         vmax = min(vmax, ticks[-1] + range_)
 
         # Pad the reported tick range up to specified range
+        # NOTE: Returns an array rather than a list. Callers only iterate
+        # over the ticks or pass them to FixedLocator.
         step = ticks[1] - ticks[0]  # MaxNLocator/AutoMinorLocator steps are equal
-        ticks_lo = np.arange(ticks[0], vmin, -step)[1:][::-1].tolist()
-        ticks_hi = np.arange(ticks[-1], vmax, step)[1:].tolist()
-        ticks = ticks_lo + ticks + ticks_hi
-        return ticks
+        ticks_lo = np.arange(ticks[0], vmin, -step)[:0:-1]
+        ticks_hi = np.arange(ticks[-1], vmax, step)[1:]
+        return np.concatenate((ticks_lo, ticks, ticks_hi))
 
     @staticmethod
     def _use_dms(projection=None):
@@ -181,9 +207,9 @@ class _LonAxis(_GeoAxis):
     def _get_sanitized_ticks(self, locator):
         # Prevent ticks from looping around
         eps = 5e-10  # more than 1e-10 because we use 1e-10 in _LongitudeLocator
-        ticks = sorted(locator())
-        while ticks and ticks[-1] - eps > ticks[0] + 360 + eps:  # cut off looped ticks
-            ticks = ticks[:-1]
+        ticks = np.sort(np.asarray(locator(), dtype=float))
+        if ticks.size:  # cut off looped ticks
+            ticks = ticks[ticks - eps <= ticks[0] + 360 + eps]
 
         # Append extra ticks in case longitude/latitude limits do not encompass
         # the entire view range of map, e.g. for Lambert Conformal sectors.
@@ -228,8 +254,8 @@ class _LatAxis(_GeoAxis):
         # Adjust latitude ticks to fix bug in some projections. Harmless for basemap.
         # NOTE: Maybe fixed by cartopy v0.18?
         eps = 5e-10
-        ticks = sorted(locator())
-        if ticks:
+        ticks = np.sort(np.asarray(locator(), dtype=float))
+        if ticks.size:
             if ticks[0] == -90:
                 ticks[0] += eps
             if ticks[-1] == 90:
@@ -242,7 +268,7 @@ class _LatAxis(_GeoAxis):
 
         # Filter ticks to latmax range
         latmax = self.get_latmax()
-        ticks = [l for l in ticks if -latmax <= l <= latmax]
+        ticks = ticks[(ticks >= -latmax) & (ticks <= latmax)]
 
         return ticks
 
@@ -441,23 +467,40 @@ optional
         # Format axes
         rc_kw, rc_mode, kwargs = self._parse_format(**kwargs)
         with rc.context(rc_kw, mode=rc_mode):
+            # Look up context settings in one pass
+            kw_rc = rc.fill(
+                {
+                    'grid': 'grid',
+                    'gridminor': 'gridminor',
+                    'labels': 'grid.labels',
+                    'latmax': 'grid.latmax',
+                    'loninline': 'grid.loninline',
+                    'latinline': 'grid.latinline',
+                    'labelpad': 'grid.pad',
+                    'rotatelabels': 'grid.rotatelabels',
+                    'dms': 'grid.dmslabels',
+                    'nsteps': 'grid.nsteps',
+                },
+                context=True,
+            )
+
             # Gridline toggles
-            grid = rc.get('grid', context=True)
-            gridminor = rc.get('gridminor', context=True)
+            grid = kw_rc.get('grid', None)
+            gridminor = kw_rc.get('gridminor', None)
             longrid = _not_none(longrid, grid)
             latgrid = _not_none(latgrid, grid)
             longridminor = _not_none(longridminor, gridminor)
             latgridminor = _not_none(latgridminor, gridminor)
 
             # Label toggles
-            labels = _not_none(labels, rc.get('grid.labels', context=True))
+            labels = _not_none(labels, kw_rc.get('labels', None))
             lonlabels = _not_none(lonlabels, labels)
             latlabels = _not_none(latlabels, labels)
             lonarray = self._to_label_array(lonlabels, lon=True)
             latarray = self._to_label_array(latlabels, lon=False)
 
             # Update 'maximum latitude'
-            latmax = _not_none(latmax, rc.get('grid.latmax', context=True))
+            latmax = _not_none(latmax, kw_rc.get('latmax', None))
             if latmax is not None:
                 self._lataxis.set_latmax(latmax)
 
@@ -502,14 +545,12 @@ optional
                 self._lataxis.set_minor_locator(locator)
 
             # Update formatters
-            loninline = _not_none(loninline, rc.get('grid.loninline', context=True))
-            latinline = _not_none(latinline, rc.get('grid.latinline', context=True))
-            labelpad = _not_none(labelpad, rc.get('grid.pad', context=True))
-            rotatelabels = _not_none(
-                rotatelabels, rc.get('grid.rotatelabels', context=True)
-            )
-            dms = _not_none(dms, rc.get('grid.dmslabels', context=True))
-            nsteps = _not_none(nsteps, rc.get('grid.nsteps', context=True))
+            loninline = _not_none(loninline, kw_rc.get('loninline', None))
+            latinline = _not_none(latinline, kw_rc.get('latinline', None))
+            labelpad = _not_none(labelpad, kw_rc.get('labelpad', None))
+            rotatelabels = _not_none(rotatelabels, kw_rc.get('rotatelabels', None))
+            dms = _not_none(dms, kw_rc.get('dms', None))
+            nsteps = _not_none(nsteps, kw_rc.get('nsteps', None))
             if lonformatter is not None:
                 lonformatter_kw = lonformatter_kw or {}
                 formatter = constructor.Formatter(lonformatter, **lonformatter_kw)
@@ -525,18 +566,33 @@ optional
                 self._lataxis.get_major_locator()._dms = dms
 
             # Apply worker functions
-            self._update_extent(lonlim=lonlim, latlim=latlim, boundinglat=boundinglat)
-            self._update_boundary(patch_kw or {})
-            self._update_features()
-            self._update_major_gridlines(
-                longrid=longrid, latgrid=latgrid,  # gridline toggles
-                lonarray=lonarray, latarray=latarray,  # label toggles
-                loninline=loninline, latinline=latinline, rotatelabels=rotatelabels,
-                labelpad=labelpad, nsteps=nsteps,
-            )
-            self._update_minor_gridlines(
-                longrid=longridminor, latgrid=latgridminor, nsteps=nsteps,
+            # NOTE: Skip these when format() was only passed e.g. title settings
+            # and nothing related to the map boundary, features, or gridlines.
+            update = self._has_geo_settings() or any(
+                arg is not None for arg in (
+                    lonlim, latlim, boundinglat, patch_kw,
+                    longrid, latgrid, longridminor, latgridminor,
+                    lonlabels, latlabels, latmax, dms,
+                    lonlocator, latlocator, lonminorlocator, latminorlocator,
+                    lonformatter, latformatter,
+                    loninline, latinline, labelpad, rotatelabels, nsteps,
+                )
             )
+            if update:
+                self._update_extent(
+                    lonlim=lonlim, latlim=latlim, boundinglat=boundinglat
+                )
+                self._update_boundary(patch_kw or {})
+                self._update_features()
+                self._update_major_gridlines(
+                    longrid=longrid, latgrid=latgrid,  # gridline toggles
+                    lonarray=lonarray, latarray=latarray,  # label toggles
+                    loninline=loninline, latinline=latinline,
+                    rotatelabels=rotatelabels, labelpad=labelpad, nsteps=nsteps,
+                )
+                self._update_minor_gridlines(
+                    longrid=longridminor, latgrid=latgridminor, nsteps=nsteps,
+                )
 
             # Call main axes format method
             super().format(**kwargs)
@@ -556,25 +612,37 @@ optional
             raise ValueError(f'Unexpected grid.below value {axisbelow!r}.')
         return zorder
 
+    @staticmethod
+    def _has_geo_settings(prefixes=None):
+        """
+        Return whether settings used by the map boundary, feature, and gridline
+        worker functions may have changed in the current context block. Use
+        `prefixes` to check a subset of settings.
+        """
+        prefixes = _not_none(prefixes, GEO_SETTINGS)
+        if rc._get_context_mode() != 2:
+            return True
+        return any(
+            key.startswith(prefixes)
+            for context in rc._context for key in context.rc_new
+        )
+
     def _get_boundary_props(self):
         """
         Return map boundary properties.
         """
         rc_mode = rc._get_context_mode()
-        kw_face = rc.fill(
+        kw = rc.fill(
             {
                 'facecolor': 'axes.facecolor',
                 'alpha': 'axes.alpha',
-            },
-            context=(rc_mode == 2),
-        )
-        kw_edge = rc.fill(
-            {
                 'linewidth': 'axes.linewidth',
                 'edgecolor': 'axes.edgecolor',
             },
             context=(rc_mode == 2),
         )
+        kw_face = {key: kw[key] for key in ('facecolor', 'alpha') if key in kw}
+        kw_edge = {key: kw[key] for key in ('linewidth', 'edgecolor') if key in kw}
         kw_edge['capstyle'] = 'projecting'  # NOTE: needed to fix cartopy bounds
         return kw_face, kw_edge
 
@@ -655,11 +723,14 @@ optional
             return [None] * 4
         if isinstance(labels, str):
             array = [False] * 4
-            for idx, char in enumerate('lrbt'):
-                if char in labels:
+            for char in labels:
+                idx = LABEL_SIDES.get(char, None)
+                if idx is not None:
                     array[idx] = True
-        else:
-            array = np.atleast_1d(labels).tolist()
+        elif np.iterable(labels):
+            array = list(labels)
+        else:  # common case of single boolean
+            array = [labels]
         if len(array) == 1:
             array.append(False)  # default is to label bottom or left
         if len(array) == 2:
@@ -699,6 +770,7 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         pcrs.SouthPolarLambertAzimuthalEqualArea
     )
     _proj_polar = _proj_north + _proj_south
+    _proj_poles = {}  # cache of projection class polarity
 
     def __init__(self, *args, autoextent=None, map_projection=None, **kwargs):
         """
@@ -723,12 +795,13 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         # GeoAxes initialization. Note that critical attributes like
         # outline_patch needed by _format_apply are added before it is called.
         # NOTE: Initial extent is configured in _update_extent
-        import cartopy  # noqa: F401
+        if ccrs is None:
+            raise ModuleNotFoundError('CartopyAxes requires cartopy.')
         if not isinstance(map_projection, ccrs.Projection):
             raise ValueError('GeoAxes requires map_projection=cartopy.crs.Projection.')
         latmax = 90
         boundinglat = None
-        polar = isinstance(map_projection, self._proj_polar)
+        polar = self._get_pole(map_projection) is not None
         if polar:
             latmax = 80
             boundinglat = 0
@@ -739,9 +812,12 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
 
         # Initialize axes
         self._boundinglat = None  # NOTE: must start at None so _update_extent acts
-        self._map_projection = map_projection  # cartopy also does this
+        self._lonlatlim = None
+        self.projection = map_projection  # cartopy also does this
         self._gridlines_major = None
         self._gridlines_minor = None
+        self._gridlines_major_kw = {}  # settings stored until gridliners exist
+        self._gridlines_minor_kw = {}
         self._lonaxis = _LonAxis(self, projection=map_projection)
         self._lataxis = _LatAxis(self, latmax=latmax, projection=map_projection)
         super().__init__(*args, map_projection=map_projection, **kwargs)
@@ -783,7 +859,27 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         """
         Get the central longitude. Default is ``0``.
         """
-        return self.projection.proj4_params.get('lon_0', 0)
+        return self._map_lon0
+
+    @classmethod
+    def _get_pole(cls, projection):
+        """
+        Return ``'north'`` or ``'south'`` for polar projections and ``None``
+        otherwise. The result is cached for each projection class.
+        """
+        key = type(projection)
+        try:
+            return cls._proj_poles[key]
+        except KeyError:
+            pass
+        if isinstance(projection, cls._proj_north):
+            pole = 'north'
+        elif isinstance(projection, cls._proj_south):
+            pole = 'south'
+        else:
+            pole = None
+        cls._proj_poles[key] = pole
+        return pole
 
     def _init_gridlines(self):
         """
@@ -797,7 +893,8 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
             result = type(self)._draw_gridliner(self, *args, **kwargs)
             if _version_cartopy == _version('0.18'):
                 lon_lim, _ = self._axes_domain()
-                if abs(np.diff(lon_lim)) == abs(np.diff(self.crs.x_limits)):
+                x_lim = self.crs.x_limits
+                if abs(lon_lim[1] - lon_lim[0]) == abs(x_lim[1] - x_lim[0]):
                     for collection in self.xline_artists:
                         if not getattr(collection, '_cartopy_fix', False):
                             collection.get_paths().pop(-1)
@@ -809,8 +906,7 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         def _axes_domain(self, *args, **kwargs):
             x_range, y_range = type(self)._axes_domain(self, *args, **kwargs)
             if _version_cartopy < _version('0.18'):
-                lon_0 = self.axes.projection.proj4_params.get('lon_0', 0)
-                x_range = np.asarray(x_range) + lon_0
+                x_range = np.asarray(x_range) + self.axes._get_lon0()
             return x_range, y_range
 
         # Cartopy < 0.18 gridliner method monkey patch. Always print number in range
@@ -831,7 +927,7 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         # with default 5 points, then set to default None in v0.18.
         # TODO: Cartopy has had two formatters for a while but we use newer one
         # https://github.com/SciTools/cartopy/pull/1066
-        gl = self.gridlines(crs=ccrs.PlateCarree())
+        gl = self.gridlines(crs=_get_platecarree())
         gl._draw_gridliner = _draw_gridliner.__get__(gl)  # apply monkey patch
         gl._axes_domain = _axes_domain.__get__(gl)
         gl._add_gridline_label = _add_gridline_label.__get__(gl)
@@ -875,20 +971,19 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         eps = 1e-10  # bug with full -180, 180 range when lon_0 != 0
         lon0 = self._get_lon0()
         proj = type(self.projection).__name__
-        north = isinstance(self.projection, self._proj_north)
-        south = isinstance(self.projection, self._proj_south)
+        pole = self._get_pole(self.projection)
         extent = None
-        if north or south:
+        if pole is not None:
             if lonlim is not None or latlim is not None:
                 warnings._warn_proplot(
                     f'{proj!r} extent is controlled by "boundinglat", '
                     f'ignoring lonlim={lonlim!r} and latlim={latlim!r}.'
                 )
             if boundinglat is not None and boundinglat != self._boundinglat:
-                lat0 = 90 if north else -90
+                lat0 = 90 if pole == 'north' else -90
                 lon0 = self._get_lon0()
                 extent = [lon0 - 180 + eps, lon0 + 180 - eps, boundinglat, lat0]
-                self.set_extent(extent, crs=ccrs.PlateCarree())
+                self.set_extent(extent, crs=_get_platecarree())
                 self._boundinglat = boundinglat
 
         # Rectangular extent
@@ -911,7 +1006,11 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
                 if latlim[1] is None:
                     latlim[1] = 90
                 extent = lonlim + latlim
-                self.set_extent(extent, crs=ccrs.PlateCarree())
+                # NOTE: Also record the view limits so the cache is invalidated
+                # when set_extent, set_global, or autoscaling change the extent.
+                if self._lonlatlim != (extent, self.viewLim.bounds):
+                    self.set_extent(extent, crs=_get_platecarree())
+                    self._lonlatlim = (extent, self.viewLim.bounds)
 
     def _update_boundary(self, patch_kw=None):
         """
@@ -950,9 +1049,11 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
                 f'Invalid resolution {reso!r}. Options are: '
                 + ', '.join(map(repr, constructor.CARTOPY_RESOS)) + '.'
             )
-        for name, args in constructor.CARTOPY_FEATURES.items():
+        features = constructor.CARTOPY_FEATURES
+        toggles = rc.fill({name: name for name in features}, context=True)
+        for name, args in features.items():
             # Draw feature or toggle feature off
-            b = rc.get(name, context=True)
+            b = toggles.get(name, None)
             attr = f'_{name}_feature'
             feat = getattr(self, attr, None)
             drawn = feat is not None  # if exists, apply *updated* settings
@@ -960,30 +1061,37 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
                 if not b:
                     if drawn:  # toggle existing feature off
                         feat.set_visible(False)
+                elif drawn:  # toggle existing feature on
+                    feat.set_visible(True)
                 else:
-                    if not drawn:
-                        feat = cfeature.NaturalEarthFeature(*args, reso)
-                        feat = self.add_feature(feat)  # convert to FeatureArtist
+                    feat = _get_natural_earth(*args, reso)
+                    feat = self.add_feature(feat)  # convert to FeatureArtist
+                    setattr(self, attr, feat)
 
             # Update artist attributes (FeatureArtist._kwargs used back to v0.5).
             # For 'lines', need to specify edgecolor and facecolor
             # See: https://github.com/SciTools/cartopy/issues/803
-            if feat is not None:
-                kw = rc.category(name, context=drawn)
-                if name in ('coast', 'rivers', 'borders', 'innerborders'):
-                    kw.update({'edgecolor': kw.pop('color'), 'facecolor': 'none'})
-                else:
-                    kw.update({'linewidth': 0})
-                if 'zorder' in kw:
-                    # NOTE: Necessary to update zorder directly because _kwargs
-                    # attributes are not applied until draw()... at which point
-                    # matplotlib is drawing in the order based on the *old* zorder.
-                    feat.set_zorder(kw['zorder'])
-                if hasattr(feat, '_kwargs'):
-                    feat._kwargs.update(kw)
+            # NOTE: Skip the rc.category() search for existing features whose
+            # settings were not changed in this context block.
+            if feat is None or (drawn and not self._has_geo_settings(name + '.')):
+                continue
+            kw = rc.category(name, context=drawn)
+            if name in ('coast', 'rivers', 'borders', 'innerborders'):
+                if 'color' in kw:
+                    kw['edgecolor'] = kw.pop('color')
+                kw['facecolor'] = 'none'
+            else:
+                kw['linewidth'] = 0
+            if 'zorder' in kw:
+                # NOTE: Necessary to update zorder directly because _kwargs
+                # attributes are not applied until draw()... at which point
+                # matplotlib is drawing in the order based on the *old* zorder.
+                feat.set_zorder(kw['zorder'])
+            if hasattr(feat, '_kwargs'):
+                feat._kwargs.update(kw)
 
     def _update_gridlines(
-        self, gl, which='major', longrid=None, latgrid=None, nsteps=None,
+        self, gl, which='major', longrid=None, latgrid=None, nsteps=None, init=False,
     ):
         """
         Update gridliner object with axis locators, and toggle gridlines on and off.
@@ -991,8 +1099,13 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         # Update gridliner collection properties
         # WARNING: Here we use apply existing *matplotlib* rc param to brand new
         # *proplot* setting. So if rc mode is 1 (first format call) use context=False.
+        # Also use context=False for gridliners created after the first format call.
         rc_mode = rc._get_context_mode()
-        kwlines, kwtext = self._get_gridline_props(which=which, context=(rc_mode == 2))
+        if init:
+            nsteps = _not_none(nsteps, rc['grid.nsteps'])
+        kwlines, kwtext = self._get_gridline_props(
+            which=which, context=(not init and rc_mode == 2)
+        )
         gl.collection_kwargs.update(kwlines)
         gl.xlabel_style.update(kwtext)
         gl.ylabel_style.update(kwtext)
@@ -1021,11 +1134,32 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         Update major gridlines.
         """
         # Update gridline locations and style
-        if not self._gridlines_major:
-            self._gridlines_major = self._init_gridlines()
+        # NOTE: The gridliner is only created once gridlines or labels are
+        # requested. Settings passed before then are stored and applied on
+        # creation, and the rest fall back to the default rc settings.
         gl = self._gridlines_major
+        init = gl is None
+        if init:
+            kw = self._gridlines_major_kw
+            kw.update({
+                key: value for key, value in (
+                    ('loninline', loninline), ('latinline', latinline),
+                    ('labelpad', labelpad), ('rotatelabels', rotatelabels),
+                    ('nsteps', nsteps),
+                ) if value is not None
+            })
+            if not any((longrid, latgrid, *lonarray, *latarray)):
+                return
+            gl = self._gridlines_major = self._init_gridlines()
+            loninline = _not_none(kw.get('loninline'), rc['grid.loninline'])
+            latinline = _not_none(kw.get('latinline'), rc['grid.latinline'])
+            labelpad = _not_none(kw.get('labelpad'), rc['grid.pad'])
+            rotatelabels = _not_none(kw.get('rotatelabels'), rc['grid.rotatelabels'])
+            nsteps = kw.get('nsteps', None)
+            kw.clear()
         self._update_gridlines(
             gl, which='major', longrid=longrid, latgrid=latgrid, nsteps=nsteps,
+            init=init,
         )
 
         # Update gridline label parameters
@@ -1067,11 +1201,19 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         """
         Update minor gridlines.
         """
-        if not self._gridlines_minor:
-            self._gridlines_minor = self._init_gridlines()
         gl = self._gridlines_minor
+        init = gl is None
+        if init:
+            kw = self._gridlines_minor_kw
+            if nsteps is not None:
+                kw['nsteps'] = nsteps
+            if not longrid and not latgrid:
+                return
+            gl = self._gridlines_minor = self._init_gridlines()
+            nsteps = kw.pop('nsteps', None)
         self._update_gridlines(
             gl, which='minor', longrid=longrid, latgrid=latgrid, nsteps=nsteps,
+            init=init,
         )
 
     def get_tightbbox(self, renderer, *args, **kwargs):
@@ -1109,7 +1251,7 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
     def get_extent(self, crs=None):
         # Get extent and try to repair longitude bounds.
         if crs is None:
-            crs = ccrs.PlateCarree()
+            crs = _get_platecarree()
         extent = super().get_extent(crs=crs)
         if isinstance(crs, ccrs.PlateCarree):
             if np.isclose(extent[0], -180) and np.isclose(extent[-1], 180):
@@ -1132,11 +1274,12 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         # resulting extent is the opposite. But that means user has messed up anyway
         # so probably doesn't matter if gridlines are also wrong.
         if crs is None:
-            crs = ccrs.PlateCarree()
+            crs = _get_platecarree()
         if isinstance(crs, ccrs.PlateCarree):
             self._set_view_intervals(extent)
-            self._update_gridlines(self._gridlines_major)
-            self._update_gridlines(self._gridlines_minor)
+            for gl in (self._gridlines_major, self._gridlines_minor):
+                if gl is not None:
+                    self._update_gridlines(gl)
             if _version_cartopy < _version('0.18'):
                 clipped_path = self.outline_patch.orig_path.clip_to_bbox(self.viewLim)
                 self.outline_patch._path = clipped_path
@@ -1161,6 +1304,7 @@ class CartopyAxes(GeoAxes, GeoAxesBase):
         if not isinstance(map_projection, ccrs.CRS):
             raise ValueError('Projection must be a cartopy.crs.CRS instance.')
         self._map_projection = map_projection
+        self._map_lon0 = map_projection.proj4_params.get('lon_0', 0)
 
     # Wrapped methods
     # TODO: Remove this duplication!
@@ -1220,15 +1364,16 @@ class BasemapAxes(GeoAxes):
     """
     #: The registered projection name.
     name = 'basemap'
-    _proj_north = ('npaeqd', 'nplaea', 'npstere')
-    _proj_south = ('spaeqd', 'splaea', 'spstere')
-    _proj_polar = _proj_north + _proj_south
-    _proj_non_rectangular = _proj_polar + (  # do not use axes spines as boundaries
+    _proj_north = frozenset(('npaeqd', 'nplaea', 'npstere'))
+    _proj_south = frozenset(('spaeqd', 'splaea', 'spstere'))
+    _proj_polar = _proj_north | _proj_south
+    _proj_non_rectangular = frozenset((  # do not use axes spines as boundaries
+        *_proj_polar,
         'ortho', 'geos', 'nsper',
         'moll', 'hammer', 'robin',
         'eck4', 'kav7', 'mbtfpq',
         'sinu', 'vandg',
-    )
+    ))
 
     def __init__(self, *args, map_projection=None, **kwargs):
         """
@@ -1252,13 +1397,14 @@ class BasemapAxes(GeoAxes):
         # WARNING: Investigated whether Basemap.__init__() could be called
         # twice with updated proj kwargs to modify map bounds after creation
         # and python immmediately crashes. Do not try again.
-        import mpl_toolkits.basemap  # noqa: F401 verify available
+        if mbasemap is None:
+            raise ModuleNotFoundError('BasemapAxes requires basemap.')
         if not isinstance(map_projection, mbasemap.Basemap):
             raise ValueError(
                 'BasemapAxes requires map_projection=basemap.Basemap'
             )
         map_projection = copy.copy(map_projection)
-        self._map_projection = map_projection
+        self.projection = map_projection
         lon0 = self._get_lon0()
         if map_projection.projection in self._proj_polar:
             latmax = 80  # default latmax for gridlines
@@ -1273,15 +1419,20 @@ class BasemapAxes(GeoAxes):
             attrs = ('lonmin', 'lonmax', 'latmin', 'latmax')
             extent = [getattr(map_projection, attr, None) for attr in attrs]
             if any(_ is None for _ in extent):
-                extent = [180 - lon0, 180 + lon0, -90, 90]  # fallback
+                extent = [-180 + lon0, 180 + lon0, -90, 90]  # fallback
 
         # Initialize axes
         self._map_boundary = None  # start with empty map boundary
-        self._has_recurred = False  # use this to override plotting methods
-        self._lonlines_major = None  # store gridliner objects this way
+        self._active_methods = set()  # use this to override plotting methods
+        self._extent_warned = False  # warn about lonlim, latlim once
+        self._lonlines_major = None  # store gridline collections and labels this way
         self._lonlines_minor = None
         self._latlines_major = None
         self._latlines_minor = None
+        self._lonarray_major = None  # store label toggles this way
+        self._lonarray_minor = None
+        self._latarray_major = None
+        self._latarray_minor = None
         self._lonaxis = _LonAxis(self)
         self._lataxis = _LatAxis(self, latmax=latmax)
         self._set_view_intervals(extent)
@@ -1291,24 +1442,47 @@ class BasemapAxes(GeoAxes):
         """
         Get the central longitude.
         """
-        return getattr(self.projection, 'projparams', {}).get('lon_0', 0)
-
-    @staticmethod
-    def _iter_gridlines(dict_):
-        """
-        Iterate over longitude latitude lines.
-        """
-        dict_ = dict_ or {}
-        for pi in dict_.values():
-            for pj in pi:
-                for obj in pj:
-                    yield obj
+        return self._map_lon0
+
+    def _collect_gridlines(self, dict_):
+        """
+        Return a flat list of the longitude latitude line and label artists
+        returned by `~mpl_toolkits.basemap.Basemap.drawmeridians` and
+        `~mpl_toolkits.basemap.Basemap.drawparallels`. The individual lines
+        are replaced with a single `~matplotlib.collections.LineCollection`.
+        """
+        # NOTE: Basemap draws a separate Line2D for every meridian and parallel
+        # segment, and sets their clipping path to the map boundary for
+        # non-rectangular projections. Styles are applied afterward.
+        groups = tuple(dict_.values()) if dict_ else ()
+        lines = list(itertools.chain.from_iterable(lines for lines, _ in groups))
+        texts = list(itertools.chain.from_iterable(texts for _, texts in groups))
+        if not lines:
+            return texts
+        line = lines[0]
+        coll = mcollections.LineCollection(
+            [obj.get_xydata() for obj in lines],
+            colors=line.get_color(),
+            linewidths=line.get_linewidth(),
+            zorder=line.get_zorder(),
+        )
+        clip_path = line.get_clip_path()
+        if clip_path is not None:
+            coll.set_clip_path(clip_path)
+        for obj in lines:
+            obj.remove()
+        self.add_collection(coll, autolim=False)
+        return [coll, *texts]
 
     def _update_extent(self, lonlim=None, latlim=None, boundinglat=None):
         """
         No-op. Map bounds cannot be changed in basemap.
         """
+        # NOTE: Only warn once per axes. This is often hit from format() loops.
+        if self._extent_warned:
+            return
         if lonlim is not None or latlim is not None or boundinglat is not None:
+            self._extent_warned = True
             warnings._warn_proplot(
                 f'Got lonlim={lonlim!r}, latlim={latlim!r}, '
                 f'boundinglat={boundinglat!r}, but you cannot "zoom into" a '
@@ -1325,13 +1499,19 @@ class BasemapAxes(GeoAxes):
         """
         kw_face, kw_edge = self._get_boundary_props()
         kw_face.update(patch_kw or {})
+        rc_mode = rc._get_context_mode()
+        if rc_mode == 2 and not kw_face and set(kw_edge) == {'capstyle'}:
+            return  # e.g. format() only toggled geographic features
 
         # Rectangularly-bounded projections
         self.axesPatch = self.patch  # backwards compatibility
         if self.projection.projection not in self._proj_non_rectangular:
-            self.patch.update({**kw_face, 'edgecolor': 'none'})
+            self.patch.update(kw_face)  # may include arbitrary patch_kw properties
+            self.patch.set_edgecolor('none')
+            setters = [('set_' + key, value) for key, value in kw_edge.items()]
             for spine in self.spines.values():
-                spine.update(kw_edge)
+                for setter, value in setters:
+                    getattr(spine, setter)(value)
 
         # Non-rectangularly-bounded projections
         # NOTE: Impossible to put map bounds 'above' plotted content because
@@ -1347,8 +1527,10 @@ class BasemapAxes(GeoAxes):
                 p = self.projection._mapboundarydrawn
             self._map_boundary = p
             kw = {**kw_face, **kw_edge}
-            p.set_rasterized(False)
-            p.set_clip_on(False)
+            if p.get_rasterized():  # avoid marking stale on repeated calls
+                p.set_rasterized(False)
+            if p.get_clip_on():
+                p.set_clip_on(False)
             p.update(kw)
 
     def _update_features(self):
@@ -1357,9 +1539,11 @@ class BasemapAxes(GeoAxes):
         """
         # NOTE: Also notable are drawcounties, blumarble, drawlsmask,
         # shadedrelief, and etopo methods.
-        for name, method in constructor.BASEMAP_FEATURES.items():
+        features = self._map_features  # (name, bound method) pairs
+        toggles = rc.fill({name: name for name, _ in features}, context=True)
+        for name, method in features:
             # Draw feature or toggle on and off
-            b = rc.get(name, context=True)
+            b = toggles.get(name, None)
             attr = f'_{name}_feature'
             feat = getattr(self, attr, None)
             drawn = feat is not None  # if exists, apply *updated* settings
@@ -1367,19 +1551,24 @@ class BasemapAxes(GeoAxes):
                 if not b:
                     if drawn:  # toggle existing feature off
                         for obj in feat:
-                            feat.set_visible(False)
+                            obj.set_visible(False)
+                elif drawn:  # toggle existing feature on
+                    for obj in feat:
+                        obj.set_visible(True)
                 else:
-                    if not drawn:
-                        feat = getattr(self.projection, method)(ax=self)
+                    feat = method(ax=self)
                     if not isinstance(feat, (list, tuple)):  # list of artists?
                         feat = (feat,)
                     setattr(self, attr, feat)
 
             # Update settings
-            if feat is not None:
-                kw = rc.category(name, context=drawn)
-                for obj in feat:
-                    obj.update(kw)
+            # NOTE: Skip the rc.category() search for existing features whose
+            # settings were not changed in this context block.
+            if feat is None or (drawn and not self._has_geo_settings(name + '.')):
+                continue
+            kw = rc.category(name, context=drawn)
+            for obj in feat:
+                obj.update(kw)
 
     def _update_gridlines(
         self, which='major', longrid=None, latgrid=None, lonarray=None, latarray=None,
@@ -1389,6 +1578,8 @@ class BasemapAxes(GeoAxes):
         to update the proj4 params.
         """
         latmax = self._lataxis.get_latmax()
+        rc_mode = rc._get_context_mode()
+        props = {}
         for name, grid, array, method in zip(
             ('lon', 'lat'),
             (longrid, latgrid),
@@ -1396,30 +1587,38 @@ class BasemapAxes(GeoAxes):
             ('drawmeridians', 'drawparallels'),
         ):
             # Correct lonarray and latarray, change fromm lrbt to lrtb
+            # NOTE: Build a new list since the same array may be passed for both
             if array is not None:
-                array = list(array)
-                array[2:] = array[2:][::-1]
+                array = [array[0], array[1], array[3], array[2]]
             axis = getattr(self, f'_{name}axis')
 
             # Get gridlines
             lines = getattr(self, f'_get_{name}ticklocs')(which=which)
-            lines = list(lines)
-            if name == 'lon' and np.isclose(lines[0] + 360, lines[-1]):
+            lines = np.asarray(lines)
+            lon = name == 'lon'
+            if lon and lines.size and np.isclose(lines[0] + 360, lines[-1]):
                 lines = lines[:-1]  # prevent double labels
 
             # Figure out whether we have to redraw meridians/parallels
             # NOTE: Always update minor gridlines if major locator also changed
+            # NOTE: Passing the same label toggles as last time does not trigger
+            # a redraw. This is common with e.g. format(labels=True) in loops.
             attr = f'_{name}lines_{which}'
-            objs = getattr(self, attr)  # dictionary of previous objects
+            objs = getattr(self, attr) or []  # list of previous objects
             attrs = ['isDefault_majloc']  # always check this one
             attrs.append('isDefault_majfmt' if which == 'major' else 'isDefault_minloc')
-            rebuild = lines and (
+            attr_array = f'_{name}array_{which}'
+            array_prev = getattr(self, attr_array)  # previous label toggles
+            rebuild = lines.size > 0 and (
                 not objs
-                or any(_ is not None for _ in array)
+                or (
+                    any(_ is not None for _ in array)
+                    and [False if _ is None else _ for _ in array] != array_prev
+                )
                 or any(not getattr(axis, _) for _ in attrs)
             )
             if rebuild and objs and grid is None:  # get *previous* toggle state
-                grid = all(obj.get_visible() for obj in self._iter_gridlines(objs))
+                grid = all(obj.get_visible() for obj in objs)
 
             # Draw or redraw meridian or parallel lines
             # Also mark formatters and locators as 'default'
@@ -1428,28 +1627,37 @@ class BasemapAxes(GeoAxes):
                 formatter = axis.get_major_formatter()
                 if formatter is not None:  # use functional formatter
                     kwdraw['fmt'] = formatter
-                for obj in self._iter_gridlines(objs):
+                for obj in objs:
                     obj.set_visible(False)
                 array = [False if _ is None else _ for _ in array]  # None causes error
                 objs = getattr(self.projection, method)(
                     lines, ax=self, latmax=latmax, labels=array, **kwdraw
                 )
+                objs = self._collect_gridlines(objs)
                 setattr(self, attr, objs)
+                setattr(self, attr_array, array)
 
             # Update gridline settings
-            rc_mode = rc._get_context_mode()
-            kwlines, kwtext = self._get_gridline_props(
-                which=which, context=(not rebuild and rc_mode == 2)
-            )
-            for obj in self._iter_gridlines(objs):
-                if isinstance(obj, mtext.Text):
-                    obj.update(kwtext)
-                else:
-                    obj.update(kwlines)
+            # NOTE: Properties are shared by meridians and parallels, so only
+            # look them up once for each context setting.
+            context = not rebuild and rc_mode == 2
+            if context not in props:
+                props[context] = self._get_gridline_props(which=which, context=context)
+            kwlines, kwtext = props[context]
+            if not rebuild and grid is None and not kwlines and not kwtext:
+                continue  # e.g. format() only toggled geographic features
+            # NOTE: Resolve setter names once rather than calling Artist.update()
+            # for every meridian, parallel, and label artist.
+            setlines = [('set_' + key, value) for key, value in kwlines.items()]
+            settext = [('set_' + key, value) for key, value in kwtext.items()]
+            for obj in objs:
+                setters = settext if isinstance(obj, mtext.Text) else setlines
+                for setter, value in setters:
+                    getattr(obj, setter)(value)
 
             # Toggle existing gridlines on and off
             if grid is not None:
-                for obj in self._iter_gridlines(objs):
+                for obj in objs:
                     obj.set_visible(grid)
 
     def _update_major_gridlines(
@@ -1497,6 +1705,12 @@ class BasemapAxes(GeoAxes):
         if not isinstance(map_projection, mbasemap.Basemap):
             raise ValueError('Projection must be a basemap.Basemap instance.')
         self._map_projection = map_projection
+        self._map_lon0 = getattr(map_projection, 'projparams', {}).get('lon_0', 0)
+        self._map_methods = {}  # bound plotting methods used by _basemap_redirect
+        self._map_features = tuple(
+            (name, getattr(map_projection, method))
+            for name, method in constructor.BASEMAP_FEATURES.items()
+        )
 
     # Wrapped methods
     plot = _basemap_norecurse(_default_latlon(_plot_wrapper(_standardize_1d(
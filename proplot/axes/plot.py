@@ -34,8 +34,9 @@ from ..internals import _dummy_context, _not_none, _state_context, docstring, wa
 from ..utils import edges, edges2d, to_rgb, to_xyz, units
 
 try:
-    from cartopy.crs import PlateCarree
+    from cartopy.crs import CRS, PlateCarree
 except ModuleNotFoundError:
+    CRS = None
     PlateCarree = object
 
 __all__ = [
@@ -413,6 +414,16 @@ def _to_ndarray(data):
     return np.atleast_1d(getattr(data, 'values', data))
 
 
+@functools.lru_cache(maxsize=1)
+def _get_platecarree():
+    """
+    Return a `~cartopy.crs.PlateCarree` instance shared across all cartopy axes.
+    This prevents re-instantiating the projection every time a plotting method,
+    gridline, extent, or limit needs the default transform.
+    """
+    return PlateCarree()
+
+
 def default_latlon(self, func, *args, latlon=True, **kwargs):
     """
     Makes ``latlon=True`` the default for basemap plots.
@@ -441,7 +452,7 @@ def default_transform(self, func, *args, transform=None, **kwargs):
     # TODO: Do some cartopy methods reset backgroundpatch or outlinepatch?
     # Deleted comment reported this issue
     if transform is None:
-        transform = PlateCarree()
+        transform = _get_platecarree()
     result = func(self, *args, transform=transform, **kwargs)
     return result
 
@@ -633,44 +644,54 @@ def _enforce_bounds(x, y, xmin, xmax):
         return x, y
     # Roll in same direction if some points on right-edge extend
     # more than 360 above min longitude; *they* should be on left side
+    # NOTE: np.roll returns a copy, so only copy y below if it was not rolled
     lonroll = np.where(x > xmin + 360)[0]  # tuple of ids
     if lonroll.size:  # non-empty
         roll = x.size - lonroll.min()
         x = np.roll(x, roll)
         y = np.roll(y, roll, axis=-1)
         x[:roll] -= 360  # make monotonic
+    else:
+        y = y.copy()
 
     # Set NaN where data not in range xmin, xmax. Must be done
     # for regional smaller projections or get weird side-effects due
     # to having valid data way outside of the map boundaries
-    y = y.copy()
+    # NOTE: Combine the comparisons in place to avoid another boolean array
     if x.size - 1 == y.shape[-1]:  # test western/eastern grid cell edges
-        y[..., (x[1:] < xmin) | (x[:-1] > xmax)] = np.nan
+        mask = np.less(x[1:], xmin)
+        np.logical_or(mask, np.greater(x[:-1], xmax), out=mask)
+        y[..., mask] = np.nan
     elif x.size == y.shape[-1]:  # test the centers and pad by one for safety
-        where = np.where((x < xmin) | (x > xmax))[0]
+        mask = np.less(x, xmin)
+        np.logical_or(mask, np.greater(x, xmax), out=mask)
+        where = np.where(mask)[0]
         y[..., where[1:-1]] = np.nan
     return x, y
 
 
 def _fix_latlon(x, y):
     """
-    Ensure longitudes are monotonic and make `~numpy.ndarray` copies so the
-    contents can be modified. Ignores 2D coordinate arrays.
+    Ensure longitudes are monotonic and convert to masked arrays. The longitudes
+    are copied before they are modified. Ignores 2D coordinate arrays.
     """
     # Sanitization and bail if 2d
+    # NOTE: Callers never modify y in place and x is only modified below,
+    # so avoid copying the coordinates unless they have to be changed.
     if x.ndim == 1:
-        x = ma.array(x)
+        x = ma.asarray(x)
     if y.ndim == 1:
-        y = ma.array(y)
+        y = ma.asarray(y)
     if x.ndim != 1 or all(x < x[0]):  # skip monotonic backwards data
         return x, y
     # Enforce monotonic longitudes
+    # NOTE: Wrap points west of the first longitude in one modular pass rather
+    # than repeatedly masking and adding 360 until nothing is left.
     lon1 = x[0]
-    while True:
-        filter_ = (x < lon1)
-        if filter_.sum() == 0:
-            break
-        x[filter_] += 360
+    filter_ = (x < lon1)
+    if filter_.sum():
+        x = x.copy()
+        x[filter_] = lon1 + np.mod(x[filter_] - lon1, 360)
     return x, y
 
 
@@ -683,16 +704,19 @@ def _interp_poles(y, Z):
         p1 = Z[0, :].mean()  # pole 1, make sure is not 0D DataArray!
         p2 = Z[-1, :].mean()  # pole 2
     if hasattr(p1, 'item'):
-        p1 = np.asscalar(p1)  # happens with DataArrays
+        p1 = p1.item()  # happens with DataArrays
     if hasattr(p2, 'item'):
-        p2 = np.asscalar(p2)
+        p2 = p2.item()
     # Concatenate
+    # NOTE: Fill a preallocated array rather than concatenating repeated pole
+    # rows. The float result type matches what concatenation used to produce.
     ps = (-90, 90) if (y[0] < y[-1]) else (90, -90)
-    Z1 = np.repeat(p1, Z.shape[1])[None, :]
-    Z2 = np.repeat(p2, Z.shape[1])[None, :]
     y = ma.concatenate((ps[:1], y, ps[1:]))
-    Z = ma.concatenate((Z1, Z, Z2), axis=0)
-    return y, Z
+    Zp = ma.empty((Z.shape[0] + 2, Z.shape[1]), dtype=np.result_type(Z.dtype, float))
+    Zp[0, :] = p1
+    Zp[1:-1, :] = Z
+    Zp[-1, :] = p2
+    return y, Zp
 
 
 @docstring.add_snippets
@@ -1410,17 +1434,15 @@ def parametric_wrapper(self, func, *args, interp=0, **kwargs):
     # Interpolate values to allow for smooth gradations between values
     # (interp=False) or color switchover halfway between points
     # (interp=True). Then optionally interpolate the colormap values.
+    # NOTE: Interpolate all segments at once. Each segment contributes its
+    # starting point and the interp points after it, then the final point is added.
     if interp > 0:
-        xorig, yorig, vorig = x, y, values
-        x, y, values = [], [], []
-        for j in range(xorig.shape[0] - 1):
-            idx = slice(None)
-            if j + 1 < xorig.shape[0] - 1:
-                idx = slice(None, -1)
-            x.extend(np.linspace(xorig[j], xorig[j + 1], interp + 2)[idx].flat)
-            y.extend(np.linspace(yorig[j], yorig[j + 1], interp + 2)[idx].flat)
-            values.extend(np.linspace(vorig[j], vorig[j + 1], interp + 2)[idx].flat)
-        x, y, values = np.array(x), np.array(y), np.array(values)
+        t = np.linspace(0, 1, interp + 2)[:-1]
+        arrays = []
+        for a in (x, y, values):
+            segments = a[:-1, None] + (a[1:] - a[:-1])[:, None] * t
+            arrays.append(np.append(segments.ravel(), a[-1:] if a.size > 1 else []))
+        x, y, values = arrays
 
     # Call main function
     return func(self, x, y, values=values, **kwargs)
@@ -2111,10 +2133,6 @@ def _get_transform(self, transform):
     """
     Translates user input transform. Also used in an axes method.
     """
-    try:
-        from cartopy.crs import CRS
-    except ModuleNotFoundError:
-        CRS = None
     cartopy = getattr(self, 'name', '') == 'cartopy'
     if (
         isinstance(transform, mtransforms.Transform)
@@ -2126,7 +2144,7 @@ def _get_transform(self, transform):
     elif transform == 'axes':
         return self.transAxes
     elif transform == 'data':
-        return PlateCarree() if cartopy else self.transData
+        return _get_platecarree() if cartopy else self.transData
     elif cartopy and transform == 'map':
         return self.transData
     else:
@@ -2705,16 +2723,25 @@ def _auto_levels_locator(
 
     # Trim excess levels the locator may have supplied
     # NOTE: This part is mostly copied from matplotlib _autolev
+    # NOTE: Locator tick values are usually sorted, so use binary search to find
+    # the last level below vmin and the first level above vmax. Fall back to
+    # masks for unsorted levels, e.g. from a user-input FixedLocator.
     if not locator_kw.get('symmetric', None):
         i0, i1 = 0, len(levels)  # defaults
-        under, = np.where(levels < vmin)
-        if len(under):
-            i0 = under[-1]
+        if np.any(np.diff(levels) < 0):
+            under, = np.where(levels < vmin)
+            over, = np.where(levels > vmax)
+            nunder = under[-1] + 1 if len(under) else 0
+            iover = over[0] if len(over) else len(levels)
+        else:
+            nunder = np.searchsorted(levels, vmin)
+            iover = np.searchsorted(levels, vmax, side='right')
+        if nunder:
+            i0 = nunder - 1
             if not automin or extend in ('min', 'both'):
                 i0 += 1  # permit out-of-bounds data
-        over, = np.where(levels > vmax)
-        if len(over):
-            i1 = over[0] + 1 if len(over) else len(levels)
+        if iover < len(levels):
+            i1 = iover + 1
             if not automax or extend in ('max', 'both'):
                 i1 -= 1  # permit out-of-bounds data
         if i1 - i0 < 3:
@@ -3138,10 +3165,10 @@ def cmap_changer(
                 colors = ['w' if lum < 50 else 'k' for lum in lums]
             text_kw = {}
             for key in (*labels_kw,):  # allow dict to change size
-                if key not in (
+                if key not in {  # NOTE: set literals are compiled to frozensets
                     'levels', 'fontsize', 'colors', 'inline', 'inline_spacing',
                     'manual', 'rightside_up', 'use_clabeltext',
-                ):
+                }:
                     text_kw[key] = labels_kw.pop(key)
             labels_kw.setdefault('colors', colors)
             labels_kw.setdefault('inline_spacing', 3)
@@ -3192,13 +3219,13 @@ def cmap_changer(
     # enough to not add "dots" in corner of pcolor plots.
     # See: https://github.com/jklymak/contourfIssues
     # See: https://stackoverflow.com/q/15003353/4970632
-    if edgefix and name in (
+    if edgefix and name in {
         'pcolor', 'pcolormesh', 'pcolorfast', 'tripcolor', 'contourf', 'tricontourf'
-    ):
+    }:
         cmap = obj.get_cmap()
         if not cmap._isinit:
             cmap._init()
-        if all(cmap._lut[:-1, 3] == 1):  # skip for cmaps with transparency
+        if np.all(cmap._lut[:-1, 3] == 1):  # skip for cmaps with transparency
             edgecolor = 'face'
         else:
             edgecolor = 'none'
@@ -3208,6 +3235,8 @@ def cmap_changer(
             if hasattr(obj, 'set_edgecolor'):  # not always true for pcolorfast
                 obj.set_edgecolor(edgecolor)
         else:
+            # NOTE: Keep the public setters. The 'face' edgecolor is resolved
+            # at draw time and cannot be emulated by copying _facecolors.
             for contour in obj.collections:
                 contour.set_edgecolor(edgecolor)
                 contour.set_linewidth(0.4)
@@ -3475,20 +3504,10 @@ property-spec, optional
         # Example: If 5 columns, but final row length 3, columns 0-2 have
         # N rows but 3-4 have N-1 rows.
         ncol = _not_none(ncol, 3)
+        # NOTE: Column col of the row-major layout holds every ncol'th pair
+        # starting from col, so slicing gives each column directly.
         if order == 'C':
-            split = [  # split into rows
-                pairs[i * ncol:(i + 1) * ncol]
-                for i in range(len(pairs) // ncol + 1)
-            ]
-            nrowsmax = len(split)  # max possible row count
-            nfinalrow = len(split[-1])  # columns in final row
-            nrows = (
-                [nrowsmax] * nfinalrow + [nrowsmax - 1] * (ncol - nfinalrow)
-            )
-            fpairs = []
-            for col, nrow in enumerate(nrows):  # iterate through cols
-                fpairs.extend(split[row][col] for row in range(nrow))
-            pairs = fpairs
+            pairs = [pair for col in range(ncol) for pair in pairs[col::ncol]]
 
         # Draw legend
         leg = mlegend.Legend(self, *zip(*pairs), ncol=ncol, loc=loc, **kwargs)
@@ -3591,6 +3610,8 @@ property-spec, optional
     # legends in clunky way, e.g. entries denoting *colors* and entries denoting
     # *markers*. But would be better to add capacity for categorical labels in a
     # *single* legend like seaborn rather than multiple legends.
+    # NOTE: Resolve the setter names once rather than for every legend handle.
+    setters = [('set_' + key, value) for key, value in kw_handle.items()]
     for leg in legs:
         try:
             children = leg._legend_handle_box._children
@@ -3602,8 +3623,10 @@ property-spec, optional
             if isinstance(obj, mtext.Text):
                 leg.update(kw_text)
             else:
-                for key, value in kw_handle.items():
-                    getattr(obj, f'set_{key}', lambda value: None)(value)
+                for name, value in setters:
+                    setter = getattr(obj, name, None)
+                    if setter is not None:
+                        setter(value)
 
     # Draw manual fancy bounding box for un-aligned legend
     # WARNING: The matplotlib legendPatch transform is the default transform,
@@ -3959,6 +3982,13 @@ or colormap-spec
     # for LogNorm! In _build_discrete_norm we sometimes select evenly spaced
     # levels in log-space *between* powers of 10, so logminor ticks would be
     # misaligned with levels.
+    # NOTE: Cannot use Axes.get_size_inches because this is a native matplotlib
+    # axes. The length is used for both the default tick density and extend size.
+    width, height = self.figure.get_size_inches()
+    if orientation == 'horizontal':
+        length = width * abs(self.get_position().width)
+    else:
+        length = height * abs(self.get_position().height)
     if locator is None:
         locator = getattr(mappable, 'ticks', None)
         if locator is None:
@@ -3974,16 +4004,11 @@ or colormap-spec
 
         elif not isinstance(locator, mticker.Locator):
             # Get default maxn, try to allot 2em squares per label maybe?
-            # NOTE: Cannot use Axes.get_size_inches because this is a
-            # native matplotlib axes
-            width, height = self.figure.get_size_inches()
             if orientation == 'horizontal':
                 scale = 3  # em squares alotted for labels
-                length = width * abs(self.get_position().width)
                 fontsize = kw_ticklabels.get('size', rc['xtick.labelsize'])
             else:
                 scale = 1
-                length = height * abs(self.get_position().height)
                 fontsize = kw_ticklabels.get('size', rc['ytick.labelsize'])
             fontsize = rc._scale_font(fontsize)
             maxn = _not_none(maxn, int(length / (scale * fontsize / 72)))
@@ -3999,13 +4024,8 @@ or colormap-spec
             locator = locator[::step]
 
     # Get extend triangles in physical units
-    width, height = self.figure.get_size_inches()
-    if orientation == 'horizontal':
-        scale = width * abs(self.get_position().width)
-    else:
-        scale = height * abs(self.get_position().height)
     extendsize = units(_not_none(extendsize, rc['colorbar.extend']))
-    extendsize = extendsize / (scale - 2 * extendsize)
+    extendsize = extendsize / (length - 2 * extendsize)
 
     # Draw the colorbar
     # NOTE: Set default formatter here because we optionally apply a FixedFormatter
@@ -4075,7 +4095,7 @@ or colormap-spec
     cmap = cb.cmap
     if not cmap._isinit:
         cmap._init()
-    if any(cmap._lut[:-1, 3] < 1):
+    if np.any(cmap._lut[:-1, 3] < 1):  # vectorized check for the common opaque case
         warnings._warn_proplot(
             f'Using manual alpha-blending for {cmap.name!r} colorbar solids.'
         )
@@ -4085,10 +4105,12 @@ or colormap-spec
         cmap._isinit = True
         cmap._init = lambda: None
         # Manually fill lookup table with alpha-blended RGB colors!
-        for i in range(lut.shape[0] - 1):
-            alpha = lut[i, 3]
-            lut[i, :3] = (1 - alpha) * 1 + alpha * lut[i, :3]  # blend *white*
-            lut[i, 3] = 1
+        # NOTE: The final 'bad' color row is left alone, as before.
+        alpha = lut[:-1, 3:]  # column for broadcasting against RGB
+        rgb = lut[:-1, :3]  # view, so the blend is applied in place
+        rgb *= alpha
+        rgb += 1 - alpha  # blend *white*
+        lut[:-1, 3] = 1
         cmap._lut = lut
         # Update colorbar
         cb.cmap = cmap
@@ -4105,8 +4127,11 @@ or colormap-spec
         cb.dividers.update(kw_outline)
 
     # *Never* rasterize because it causes misalignment with border lines
+    # NOTE: Matplotlib rasterizes the solids for long colormaps, so the flag
+    # cannot be dropped. Only reset it when it was actually turned on.
     if cb.solids:
-        cb.solids.set_rasterized(False)
+        if cb.solids.get_rasterized():
+            cb.solids.set_rasterized(False)
         cb.solids.set_linewidth(0.4)
         cb.solids.set_edgecolor('face')
 
@@ -4124,12 +4149,18 @@ def _basemap_redirect(func):
     Docorator that calls the basemap version of the function of the
     same name. This must be applied as the innermost decorator.
     """
+    # NOTE: The bound basemap method is cached on the axes the first time it
+    # is used. The cache is reset whenever the basemap projection is changed.
     name = func.__name__
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         if getattr(self, 'name', '') == 'basemap':
-            return getattr(self.projection, name)(*args, ax=self, **kwargs)
+            methods = self._map_methods
+            method = methods.get(name, None)
+            if method is None:
+                method = methods[name] = getattr(self.projection, name)
+            return method(*args, ax=self, **kwargs)
         else:
             return func(self, *args, **kwargs)
     wrapper.__doc__ = None
@@ -4141,17 +4172,23 @@ def _basemap_norecurse(func):
     Decorator to prevent recursion in basemap method overrides.
     See `this post https://stackoverflow.com/a/37675810/4970632`__.
     """
+    # NOTE: The names of methods currently running are stored on the axes, so
+    # only re-entry of the *same* method (e.g. Basemap.contourf calling
+    # ax.contourf) goes straight to the matplotlib method. Nested calls to other
+    # methods (e.g. contour labels drawn with ax.contour) still get wrapped.
     name = func.__name__
-    func._called_from_basemap = False
+    method = getattr(maxes.Axes, name)
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        if func._called_from_basemap:
-            result = getattr(maxes.Axes, name)(self, *args, **kwargs)
-        else:
-            with _state_context(func, _called_from_basemap=True):
-                result = func(self, *args, **kwargs)
-        return result
+        active = self._active_methods
+        if name in active:
+            return method(self, *args, **kwargs)
+        active.add(name)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            active.discard(name)
     return wrapper
 
 
@@ -146,12 +146,12 @@ def _clip_colors(colors, clip=True, gray=0.2, warn=False):
     """
     Clip impossible colors rendered in an HSL-to-RGB colorspace conversion.
     Used by `PerceptuallyUniformColormap`. If `mask` is ``True``, impossible
-    colors are masked out.
+    colors are masked out. Arrays are clipped in-place.
 
     Parameters
     ----------
-    colors : list of length-3 tuples
-        The RGB colors.
+    colors : ndarray or list of length-3 tuples
+        The RGB colors. If this is an array it is modified in-place.
     clip : bool, optional
         If `clip` is ``True`` (the default), RGB channel values >1 are clipped
         to 1. Otherwise, the color is masked out as gray.
@@ -161,7 +161,9 @@ def _clip_colors(colors, clip=True, gray=0.2, warn=False):
     warn : bool, optional
         Whether to issue warning when colors are clipped.
     """
-    colors = np.array(colors)
+    # NOTE: PerceptuallyUniformColormap passes a view of the lookup table and
+    # assigns the result back, so clip in-place rather than copying the array.
+    colors = np.asarray(colors)
     over = colors > 1
     under = colors < 0
     if clip:
@@ -895,7 +897,7 @@ class LinearSegmentedColormap(mcolors.LinearSegmentedColormap, _Colormap):
                     x = np.linspace(0, 1, 256)  # just save the transitions
                     y = np.array([value(_) for _ in x]).squeeze()
                     value = np.vstack((x, y, y)).T
-                data[key] = np.asarray(value).astype(float).tolist()
+                data[key] = np.asarray(value, dtype=float).tolist()
             # Add critical attributes to the dictionary
             keys = ()
             if isinstance(self, PerceptuallyUniformColormap):
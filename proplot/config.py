@@ -617,16 +617,17 @@ class RcConfigurator(object):
                 ', '.join(map(repr, rcsetup._rc_categories)) + '.'
             )
         kw = {}
-        mode = 0 if not context else None
+        mode = 0 if not context else self._get_context_mode()
+        regex = re.compile(fr'\A{cat}\.[^.]+\Z')
         for rcdict in (rc_proplot, rc_matplotlib):
             for key in rcdict:
-                if not re.match(fr'\A{cat}\.[^.]+\Z', key):
+                if not regex.match(key):
                     continue
                 value = self._get_item(key, mode)
                 if value is None:
                     continue
                 if trimcat:
-                    key = re.sub(fr'\A{cat}\.', '', key)
+                    key = key[len(cat) + 1:]
                 kw[key] = value
         return kw
 
@@ -740,7 +741,7 @@ class RcConfigurator(object):
             See `~RcConfigurator.context`.
         """
         kw = {}
-        mode = 0 if not context else None
+        mode = 0 if not context else self._get_context_mode()
         for key, value in props.items():
             item = self._get_item(value, mode)
             if item is not None:
@@ -12,8 +12,10 @@ from simple shorthand arguments.
 # part of documentation, but this is redundant and pollutes the namespace.
 # User should just inspect docstrings, use trial-error, or see online tables.
 import os
+import pickle
 import re
-from functools import partial
+from collections import OrderedDict
+from functools import lru_cache, partial
 from numbers import Number
 
 import cycler
@@ -310,6 +312,8 @@ BASEMAP_RESOS = {
     'x-hi': 'h',
     'xx-hi': 'f',  # fine
 }
+BASEMAP_CACHE = OrderedDict()  # pickled basemap instances keyed by their settings
+BASEMAP_CACHE_SIZE = 8  # high-resolution instances carry large coastline arrays
 
 # Geographic feature properties
 CARTOPY_FEATURES = {  # positional arguments passed to NaturalEarthFeature
@@ -355,6 +359,17 @@ def _mod_colormap(cmap, *, cut, left, right, shift, reverse, samples):
     return cmap
 
 
+@lru_cache(maxsize=128)
+def _get_cartopy_crs(crs, items):
+    """
+    Return a shared cartopy projection instance. Constructing projections
+    parses the PROJ definition, so cache them.
+    """
+    proj = crs(**dict(items))
+    proj._proj_package = 'cartopy'
+    return proj
+
+
 def Colors(*args, **kwargs):
     """
     Pass all arguments to `Cycle` and return the list of colors from
@@ -913,8 +928,12 @@ def Locator(locator, *args, **kwargs):
         return locator
 
     # Pull out extra args
-    if np.iterable(locator) and not isinstance(locator, str) and not all(
-        isinstance(num, Number) for num in locator
+    # NOTE: Numeric arrays are passed through without checking each element
+    if (
+        np.iterable(locator)
+        and not isinstance(locator, str)
+        and not (isinstance(locator, np.ndarray) and locator.dtype.kind in 'iuf')
+        and not all(isinstance(num, Number) for num in locator)
     ):
         locator, args = locator[0], (*locator[1:], *args)
 
@@ -1183,7 +1202,7 @@ def Scale(scale, *args, **kwargs):
     return scale(*args, **kwargs)
 
 
-def Proj(name, basemap=None, **kwargs):
+def Proj(name, basemap=None, cache=False, **kwargs):
     """
     Return a `cartopy.crs.Projection` or `~mpl_toolkits.basemap.Basemap`
     instance. Used to interpret the `proj` and `proj_kw` arguments when
@@ -1265,6 +1284,13 @@ def Proj(name, basemap=None, **kwargs):
     basemap : bool, optional
         Whether to use the basemap package as opposed to the cartopy package.
         Default is ``False``.
+    cache : bool, optional
+        Whether to reuse projections created with identical settings. Basemap
+        instances are copied from a cache of pickled instances, so each call
+        still returns an independent instance, but up to ``8`` instances are
+        kept in memory for the rest of the session. For high resolutions these
+        include large coastline arrays. Cartopy projections are *shared*
+        between calls, so they should not be modified. Default is ``False``.
     lonlim : 2-tuple of float, optional
         Alternative way to specify `llcrnrlon` and `urcrnrlon` for basemap
         projections.
@@ -1361,7 +1387,8 @@ def Proj(name, basemap=None, **kwargs):
         # https://github.com/matplotlib/basemap/issues/361
         # NOTE: Unlike cartopy, basemap resolution is configured on
         # initialization and controls *all* features.
-        import mpl_toolkits.basemap as mbasemap
+        if Basemap is object:
+            raise ModuleNotFoundError('Proj(..., basemap=True) requires basemap.')
         if _version_mpl >= _version('3.3'):
             raise RuntimeError(
                 'Basemap is no longer maintained and is incompatible with '
@@ -1398,12 +1425,38 @@ def Proj(name, basemap=None, **kwargs):
                 + ', '.join(map(repr, BASEMAP_RESOS)) + '.'
             )
         kwproj.update({'resolution': reso, 'projection': name})
-        proj = mbasemap.Basemap(**kwproj)
+        # NOTE: Basemap processes every coastline and boundary segment on
+        # initialization, which can take seconds at high resolutions. Cache a
+        # pickled copy of the most recent instances and load it for repeated
+        # settings. Each call still gets an independent instance since figures
+        # modify basemap state.
+        key = None
+        if cache:
+            try:
+                key = tuple(sorted(kwproj.items()))
+                hash(key)
+            except TypeError:  # e.g. list-valued settings
+                key = None
+        if key is not None and key in BASEMAP_CACHE:
+            BASEMAP_CACHE.move_to_end(key)
+            proj = pickle.loads(BASEMAP_CACHE[key])
+        else:
+            proj = Basemap(**kwproj)
+            if key is not None:
+                try:
+                    data = pickle.dumps(proj, pickle.HIGHEST_PROTOCOL)
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    pass  # unpicklable settings
+                else:
+                    BASEMAP_CACHE[key] = data
+                    if len(BASEMAP_CACHE) > BASEMAP_CACHE_SIZE:
+                        BASEMAP_CACHE.popitem(last=False)
         proj._proj_package = 'basemap'
 
     # Cartopy
     else:
-        import cartopy.crs  # noqa
+        if CRS is object:
+            raise ModuleNotFoundError('Proj(..., basemap=False) requires cartopy.')
         kwproj = {
             CARTOPY_KW_ALIASES.get(key, key): value
             for key, value in kwargs.items()
@@ -1421,7 +1474,14 @@ def Proj(name, basemap=None, **kwargs):
                 f'Unknown projection {name!r}. Options are: '
                 + ', '.join(map(repr, CARTOPY_PROJS.keys())) + '.'
             )
-        proj = crs(**kwproj)
-        proj._proj_package = 'cartopy'
+        proj = None
+        if cache:
+            try:
+                proj = _get_cartopy_crs(crs, tuple(sorted(kwproj.items())))
+            except TypeError:  # e.g. list-valued standard_parallels
+                pass
+        if proj is None:
+            proj = crs(**kwproj)
+            proj._proj_package = 'cartopy'
 
     return proj
@@ -526,6 +526,7 @@ class Figure(mfigure.Figure):
         suptitle = self._suptitle
         suptitle_on = suptitle.get_text().strip()
         width, height = self.get_size_inches()
+        transform = self.transFigure.inverted()
         for side in ('left', 'right', 'bottom', 'top'):
             # Get axes and offset the label to relevant panel
             if side in ('left', 'right'):
@@ -540,6 +541,8 @@ class Figure(mfigure.Figure):
             coords = [None] * len(axs)
             if side == 'top' and suptitle_on:
                 supaxs = axs
+            if not any(label.get_text().strip() for label in labels):
+                continue  # skip toggling visibility when there is nothing to align
 
             # Adjust the labels
             with _hide_artists(*labels):
@@ -561,7 +564,7 @@ class Figure(mfigure.Figure):
                             jcoords = (0, bbox.ymax)
                         else:
                             jcoords = (0, bbox.ymin)
-                        c = self.transFigure.inverted().transform(jcoords)
+                        c = transform.transform(jcoords)
                         c = c[0] if side in ('left', 'right') else c[1]
                         icoords.append(c)
 
@@ -597,16 +600,24 @@ class Figure(mfigure.Figure):
             ys = []
             for ax in supaxs:
                 bbox = ax.get_tightbbox(renderer)
-                _, y = self.transFigure.inverted().transform((0, bbox.ymax))
+                _, y = transform.transform((0, bbox.ymax))
                 ys.append(y)
             x, _ = self._get_align_coord('top', supaxs)
             y = max(ys) + (0.3 * suptitle.get_fontsize() / 72) / height
-            kw = {
-                'x': x, 'y': y,
-                'ha': 'center', 'va': 'bottom',
-                'transform': self.transFigure
-            }
-            suptitle.update(kw)
+            # NOTE: Text.update invalidates the cached text layout, so skip it
+            # when the title is already in place (e.g. on repeated interactive draws)
+            if (
+                suptitle.get_position() != (x, y)
+                or suptitle.get_ha() != 'center'
+                or suptitle.get_va() != 'bottom'
+                or suptitle.get_transform() is not self.transFigure
+            ):
+                kw = {
+                    'x': x, 'y': y,
+                    'ha': 'center', 'va': 'bottom',
+                    'transform': self.transFigure
+                }
+                suptitle.update(kw)
 
     def _context_authorize_add_subplot(self):
         """
@@ -662,19 +673,23 @@ class Figure(mfigure.Figure):
             ]
 
         # Get coordinates
+        # NOTE: argmin and argmax return the first occurrence, i.e. the first axes
+        # along the minimum and maximum gridspec edges.
         ranges = np.array([ax._range_gridspec(x) for ax in axs])
-        min_, max_ = ranges[:, 0].min(), ranges[:, 1].max()
-        ax_lo = axs[np.where(ranges[:, 0] == min_)[0][0]]
-        ax_hi = axs[np.where(ranges[:, 1] == max_)[0][0]]
+        idx_lo, idx_hi = np.argmin(ranges[:, 0]), np.argmax(ranges[:, 1])
+        ax_lo, ax_hi = axs[idx_lo], axs[idx_hi]
         box_lo = ax_lo.get_subplotspec().get_position(self)
-        box_hi = ax_hi.get_subplotspec().get_position(self)
+        if ax_hi is ax_lo:
+            box_hi = box_lo  # avoid walking the gridspec geometry twice
+        else:
+            box_hi = ax_hi.get_subplotspec().get_position(self)
         if x == 'x':
             pos = 0.5 * (box_lo.x0 + box_hi.x1)
         else:
             pos = 0.5 * (box_lo.y1 + box_hi.y0)  # 'lo' is actually on top of figure
 
         # Return axis suitable for spanning position
-        ax_span = axs[(np.argmin(ranges[:, 0]) + np.argmax(ranges[:, 1])) // 2]
+        ax_span = axs[(idx_lo + idx_hi) // 2]
         ax_span = ax_span._panel_parent or ax_span
         return pos, ax_span
 
@@ -695,15 +710,16 @@ class Figure(mfigure.Figure):
         if not axs:
             return []
         ranges = np.array([ax._range_gridspec(x) for ax in axs])
-        min_, max_ = ranges[:, 0].min(), ranges[:, 1].max()
-        edge = min_ if side in ('left', 'top') else max_
+        edge = ranges[:, idx].min() if idx == 0 else ranges[:, idx].max()
 
         # Return axes on edge sorted by order of appearance
+        # NOTE: Sort with a key so that the axes themselves are never compared
         axs = [
-            ax for ax in self._axes_main if ax._range_gridspec(x)[idx] == edge
+            ax for ax, range_ in zip(axs, ranges)
+            if range_[idx] == edge and ax.get_visible()
         ]
-        ranges = [ax._range_gridspec(y)[0] for ax in axs]
-        return [ax for _, ax in sorted(zip(ranges, axs)) if ax.get_visible()]
+        axs.sort(key=lambda ax: ax._range_gridspec(y)[0])
+        return axs
 
     def _get_renderer(self):
         """
@@ -961,6 +977,12 @@ class Figure(mfigure.Figure):
         wspace_orig = subplots_orig_kw['wspace']
         hspace_orig = subplots_orig_kw['hspace']
 
+        # Get gridspec ranges and tight bounding box spans for every axes
+        # NOTE: Bounding boxes were cached on the axes by get_tightbbox() above.
+        # Query everything once rather than once per space and per row or column.
+        ranges = {x: np.array([ax._range_gridspec(x) for ax in axs]) for x in 'xy'}
+        spans = {x: np.array([ax._range_tightbbox(x) for ax in axs]) for x in 'xy'}
+
         # Get new subplot spacings, axes panel spacing, figure panel spacing
         spaces = []
         for (w, x, y, nacross, ispace, ispace_orig) in zip(
@@ -970,8 +992,9 @@ class Figure(mfigure.Figure):
             # Determine which rows and columns correspond to panels
             panels = subplots_kw[w + 'panels']
             jspace = [*ispace]
-            ralong = np.array([ax._range_gridspec(x) for ax in axs])
-            racross = np.array([ax._range_gridspec(y) for ax in axs])
+            ralong = ranges[x]
+            racross = ranges[y]
+            span = spans[x]
             for i, (space, space_orig) in enumerate(zip(ispace, ispace_orig)):
                 # Figure out whether this is a normal space, or a
                 # panel stack space/axes panel space
@@ -994,7 +1017,7 @@ class Figure(mfigure.Figure):
 
                     # Get indices
                     filt = (racross[:, 0] <= j) & (j <= racross[:, 1])
-                    if sum(filt) < 2:  # no interface here
+                    if np.count_nonzero(filt) < 2:  # no interface here
                         continue
                     idx1, = np.where(filt & filt1)
                     idx2, = np.where(filt & filt2)
@@ -1007,7 +1030,8 @@ class Figure(mfigure.Figure):
 
                     # Put these axes into unique groups. Store groups as
                     # (left axes, right axes) or (bottom axes, top axes) pairs.
-                    ax1, ax2 = axs[idx1], axs[idx2]
+                    # NOTE: Groups store indices into axs rather than the axes.
+                    ax1, ax2 = idx1, idx2
                     if x != 'x':  # order bottom-to-top
                         ax1, ax2 = ax2, ax1
                     newgroup = True
@@ -1025,8 +1049,8 @@ class Figure(mfigure.Figure):
                 # so panels spaces are located where i % 3 is 1 or 2
                 jspaces = []
                 for (group1, group2) in groups:
-                    x1 = max(ax._range_tightbbox(x)[1] for ax in group1)
-                    x2 = min(ax._range_tightbbox(x)[0] for ax in group2)
+                    x1 = max(span[idx, 1] for idx in group1)
+                    x2 = min(span[idx, 0] for idx in group2)
                     jspaces.append((x2 - x1) / self.dpi)
                 if jspaces:
                     space = max(0, space - min(jspaces) + pad)
@@ -24,26 +24,24 @@ def _not_none(*args, default=None, **kwargs):
     for setting default values. Use `kwargs` to issue warnings when multiple
     non-``None`` values were passed. Use `args` to just ignore extra values.
     """
-    first = default
+    # NOTE: This is called for nearly every keyword argument in format() and the
+    # plotting wrappers, so return as soon as possible.
     if args and kwargs:
         raise ValueError('_not_none can only be used with args or kwargs.')
     elif args:
         for arg in args:
             if arg is not None:
-                first = arg
-                break
+                return arg
     elif kwargs:
-        for name, arg in list(kwargs.items()):
-            if arg is not None:
-                first = arg
-                break
         kwargs = {name: arg for name, arg in kwargs.items() if arg is not None}
         if len(kwargs) > 1:
             warnings._warn_proplot(
                 f'Got conflicting or duplicate keyword args: {kwargs}. '
                 'Using the first one.'
             )
-    return first
+        for arg in kwargs.values():
+            return arg
+    return default
 
 
 class _dummy_context(object):
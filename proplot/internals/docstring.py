@@ -8,12 +8,19 @@ import inspect
 snippets = {}
 
 
+class _StrippedSnippets(object):
+    """Mapping that strips snippets when they are requested. Used so that
+    substitution only processes the snippets a docstring actually uses."""
+    def __getitem__(self, key):
+        return snippets[key].strip()
+
+
 def add_snippets(func):
     """Decorator that dedents docstrings with `inspect.getdoc` and adds
     un-indented snippets from the global `snippets` dictionary. This function
     uses ``%(name)s`` substitution rather than `str.format` substitution so
     that the `snippets` keys can be invalid variable names."""
     func.__doc__ = inspect.getdoc(func)
-    if func.__doc__:
-        func.__doc__ %= {key: value.strip() for key, value in snippets.items()}
+    if func.__doc__ and '%' in func.__doc__:
+        func.__doc__ %= _StrippedSnippets()
     return func
@@ -3,12 +3,14 @@
 Custom warning style and deprecation functions.
 """
 import functools
-import re
 import sys
 import warnings
 
 ProPlotWarning = type('ProPlotWarning', (UserWarning,), {})
 
+# Module name prefixes skipped when computing the warning stack level
+INTERNAL_PREFIXES = ('matplotlib.', 'mpl_toolkits.', 'proplot.')
+
 
 def _warn_proplot(message):
     """
@@ -19,10 +21,7 @@ def _warn_proplot(message):
     while True:
         if frame is None:
             break  # when called in embedded context may hit frame is None
-        if not re.match(
-            r'\A(matplotlib|mpl_toolkits|proplot)\.',
-            frame.f_globals.get('__name__', '')
-        ):
+        if not frame.f_globals.get('__name__', '').startswith(INTERNAL_PREFIXES):
             break
         frame = frame.f_back
         stacklevel += 1
@@ -168,13 +168,18 @@ class _CartopyFormatter(object):
     # input values from map projection coordinates to Plate Carrée coordinates.
     # After 0.18 you can avoid this behavior by not setting axis but really
     # dislike that inconsistency. Solution is temporarily change projection.
+    # NOTE: Use the module-level cartopy import rather than importing on every
+    # instantiation, and create the Plate Carrée projection once per formatter
+    # rather than once per tick label.
     def __init__(self, *args, **kwargs):
-        import cartopy  # noqa: F401 (ensure available)
+        if ccrs is None:
+            raise ModuleNotFoundError("No module named 'cartopy'")
         super().__init__(*args, **kwargs)
+        self._platecarree = ccrs.PlateCarree()
 
     def __call__(self, value, pos=None):
         if self.axis is not None:
-            context = _state_context(self.axis.axes, projection=ccrs.PlateCarree())
+            context = _state_context(self.axis.axes, projection=self._platecarree)
         else:
             context = _dummy_context()
         with context:
@@ -376,7 +376,8 @@ list thereof, or dict thereof, optional
                 if package == 'basemap':
                     aspect = (m.urcrnrx - m.llcrnrx) / (m.urcrnry - m.llcrnry)
                 else:
-                    aspect = (np.diff(m.x_limits) / np.diff(m.y_limits))[0]
+                    (x0, x1), (y0, y1) = m.x_limits, m.y_limits
+                    aspect = (x1 - x0) / (y1 - y0)
             axes_kw[num].update({'projection': package, 'map_projection': m})
 
     # Figure and/or axes dimensions
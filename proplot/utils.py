@@ -136,10 +136,13 @@ def edges(Z, axis=-1):
     Z = np.asarray(Z)
     Z = np.swapaxes(Z, axis, -1)
     *nextra, nx = Z.shape
-    Zb = np.zeros((*nextra, nx + 1))
+    Zb = np.empty((*nextra, nx + 1))
 
     # Inner edges
-    Zb[..., 1:-1] = 0.5 * (Z[..., :-1] + Z[..., 1:])
+    # NOTE: Write midpoints directly into the output to avoid temporary arrays
+    Zi = Zb[..., 1:-1]
+    np.add(Z[..., :-1], Z[..., 1:], out=Zi)
+    Zi *= 0.5
 
     # Left, right edges
     Zb[..., 0] = 1.5 * Z[..., 0] - 0.5 * Z[..., 1]
@@ -176,9 +179,11 @@ def edges2d(Z):
     Zb = np.zeros((ny + 1, nx + 1))
 
     # Inner edges
-    Zb[1:-1, 1:-1] = 0.25 * (
-        Z[1:, 1:] + Z[:-1, 1:] + Z[1:, :-1] + Z[:-1, :-1]
-    )
+    Zi = Zb[1:-1, 1:-1]
+    np.add(Z[1:, 1:], Z[:-1, 1:], out=Zi)
+    Zi += Z[1:, :-1]
+    Zi += Z[:-1, :-1]
+    Zi *= 0.25
 
     # Left, right, top, bottom edges
     Zb[0, :] += edges(1.5 * Z[0, :] - 0.5 * Z[1, :])